@@ -0,0 +1,14 @@
+"""Put the project root on ``sys.path`` exactly once for the example scripts.
+
+Importing this module replaces the per-script
+``sys.path.insert(0, os.path.dirname(os.path.dirname(...)))`` chains: the
+root is resolved once, and the membership guard avoids duplicate ``sys.path``
+entries that would slow every subsequent import.
+"""
+
+import sys
+from pathlib import Path
+
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -8,12 +8,12 @@ This script demonstrates how to run the Career Coach agent using Youtu-agent fra
 import asyncio
 import pathlib
 
-# Import env module first to load environment variables
-from utu.utils.env import EnvUtils
-
 from utu.agents import SimpleAgent
 from utu.config import ConfigLoader
 
+# Import env module first to load environment variables
+from utu.utils.env import EnvUtils  # noqa: F401  # imported for env-loading side effect
+
 
 async def main():
     """Run the Career Coach agent with sample interactions."""
@@ -31,7 +31,8 @@ async def main():
         # Example 1: Career advice
         print("Example 1: General career advice")
         response1 = await agent.chat(
-            "I'm a software developer with 3 years of experience. I'm considering a career switch to data science. What should I do?"
+            "I'm a software developer with 3 years of experience. "
+            "I'm considering a career switch to data science. What should I do?"
         )
         print(f"Response: {response1}\n")
 
@@ -40,7 +41,8 @@ async def main():
         if resume_path.exists():
             print("Example 2: Resume analysis")
             response2 = await agent.chat(
-                f"Please analyze my resume at {resume_path} and provide feedback on how to improve it for a data science role."
+                f"Please analyze my resume at {resume_path} "
+                "and provide feedback on how to improve it for a data science role."
             )
             print(f"Response: {response2}\n")
         else:
@@ -62,7 +64,8 @@ async def main():
         print("Type your career-related questions below. Type 'quit' to exit.\n")
 
         while True:
-            user_input = input("You: ")
+            # Read input off the event loop so background tasks keep running
+            user_input = await asyncio.to_thread(input, "You: ")
             if user_input.lower() in ['quit', 'exit', 'bye']:
                 print("\n👋 Thanks for using Career Coach! Best of luck with your career journey!")
                 break
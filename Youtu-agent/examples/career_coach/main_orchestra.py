@@ -6,19 +6,51 @@ This script demonstrates the multi-agent orchestra system for comprehensive SAP
 """
 
 import asyncio
+import collections
 import pathlib
-import sys
-import os
+import re
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-# Import env module first to load environment variables
-from utu.utils.env import EnvUtils
+import bootstrap  # noqa: F401  # puts the project root on sys.path once
 
 from utu.agents import OrchestraAgent
+from utu.agents.orchestra.context_builder import (
+    ContextBuilder,
+    get_memory_summary,
+    update_agent_memories_with_response,
+)
 from utu.config import ConfigLoader
 
+# Import env module first to load environment variables
+from utu.utils.env import EnvUtils  # noqa: F401  # imported for env-loading side effect
+
+# Phrases that indicate the system asked a clarifying question; compiled once
+# so each turn does a single scan instead of nine substring searches
+_CLARIFY_RE = re.compile(
+    r"\b(?:could you|can you|would you|what about|tell me more|clarify|specify|elaborate|additional information)\b",
+    re.IGNORECASE,
+)
+
+# Kept static (and first) so upstream prompt-prefix caching can hit on it
+_CONTEXT_PREAMBLE = "Previous conversation context:\n"
+
+# History bounds: answers truncated once at append time, last N exchanges kept
+_HISTORY_SNIPPET_LEN = 200
+_HISTORY_MAX_TURNS = 3
+
+# Example SAP career coaching scenarios, frozen at import time
+_EXAMPLES: tuple[str, ...] = (
+    "I'm an SAP consultant with 3 years experience wanting to become a Solution Architect. What's my path?",
+    "I specialize in SAP HCM and want to transition to SAP SuccessFactors. How should I plan this?",
+    "I'm an SAP developer interested in moving into SAP cloud solutions. What certifications do I need?",
+    "I want to advance from SAP functional consultant to SAP presales. What skills should I develop?",
+    "How can I build expertise in SAP S/4HANA and position myself for senior technical roles?",
+)
+
+
+async def ainput(prompt: str) -> str:
+    """Prompt for input without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
 
 async def main():
     """Run the SAP Career Coach orchestra agent."""
@@ -39,34 +71,36 @@ async def main():
 
         # Debug: Show agent configuration immediately
         # print(f"🔍 Debug: Worker agents available: {list(agent.worker_agents.keys())}")
-        # print(f"🔍 Debug: Workers info keys: {list(agent.config.workers_info.keys()) if hasattr(agent.config.workers_info, 'keys') else agent.config.workers_info}")
+        # print(f"🔍 Debug: Workers info keys: {agent.config.workers_info}")
         # print()
 
-        # Example SAP career coaching scenarios
-        examples = [
-            "I'm an SAP consultant with 3 years experience wanting to become a Solution Architect. What's my path?",
-            "I specialize in SAP HCM and want to transition to SAP SuccessFactors. How should I plan this?",
-            "I'm an SAP developer interested in moving into SAP cloud solutions. What certifications do I need?",
-            "I want to advance from SAP functional consultant to SAP presales. What skills should I develop?",
-            "How can I build expertise in SAP S/4HANA and position myself for senior technical roles?"
-        ]
-
         print("💡 Example SAP Career Coaching Scenarios:")
-        for i, example in enumerate(examples, 1):
+        for i, example in enumerate(_EXAMPLES, 1):
             print(f"{i}. {example}")
 
         print("\n🎯 Interactive SAP Career Coaching")
         print("Ask complex SAP career questions. The system will ask clarifying questions when needed.\n")
         print("Commands: 'quit' to exit, 'help' for guidance, 'clear' to start fresh\n")
 
-        conversation_history = []
+        context_builder = ContextBuilder()
+        # Bounded history; answers pre-truncated at append time
+        conversation_history = collections.deque(maxlen=_HISTORY_MAX_TURNS)
         clarification_count = 0
         max_clarifications = 3
 
+        pending_memory_flush = None
+
         while True:
-            user_input = input("You: ").strip()
+            # Read input off the event loop so background tasks (memory flush,
+            # warmups) keep running while the user types
+            user_input = (await ainput("You: ")).strip()
 
             if user_input.lower() in ['quit', 'exit', 'bye']:
+                # Settle the last turn's background memory flush so the final
+                # interaction is not dropped on exit
+                if pending_memory_flush is not None:
+                    await pending_memory_flush
+                    pending_memory_flush = None
                 print("\n👋 Thank you for using SAP Career Coach! Your SAP journey awaits!")
                 break
 
@@ -80,18 +114,33 @@ async def main():
                 continue
 
             elif user_input.lower() == 'clear':
-                conversation_history = []
+                conversation_history.clear()
                 clarification_count = 0
                 print("🧹 Conversation history cleared. Let's start fresh!\n")
                 continue
 
             try:
-                # Build context-aware query
+                # Settle last turn's background memory flush before reading
+                if pending_memory_flush is not None:
+                    await pending_memory_flush
+                    pending_memory_flush = None
+
+                # One memory read per turn: the snapshot feeds both context
+                # building and the end-of-turn memory updates
+                memories = await get_memory_summary(agent)
+                memory_context = context_builder.build_memory_context_string(memories, conversation_history)
+                if hasattr(agent.planner_agent, "memory_context"):
+                    agent.planner_agent.memory_context = memory_context
+
+                # Build context-aware query from the bounded history
                 if conversation_history:
-                    context_query = f"Previous conversation context:\n"
-                    for i, (q, r) in enumerate(conversation_history[-3:], 1):  # Last 3 exchanges
-                        context_query += f"Q{i}: {q}\nA{i}: {r[:200]}...\n\n"
-                    context_query += f"Current user input: {user_input}"
+                    context_query = (
+                        _CONTEXT_PREAMBLE
+                        + "".join(
+                            f"Q{i}: {q}\nA{i}: {a}...\n\n" for i, (q, a) in enumerate(conversation_history, 1)
+                        )
+                        + f"Current user input: {user_input}"
+                    )
                 else:
                     context_query = user_input
 
@@ -101,8 +150,12 @@ async def main():
 
                 response = await agent.run(context_query)
 
-                # Store in conversation history
-                conversation_history.append((user_input, response.final_output))
+                # Store in conversation history; flush worker memories in the
+                # background and overlap the write with the next input prompt
+                conversation_history.append((user_input, response.final_output[:_HISTORY_SNIPPET_LEN]))
+                pending_memory_flush = asyncio.create_task(
+                    update_agent_memories_with_response(agent, memories, user_input, response.final_output)
+                )
 
                 print("\n📋 SAP Career Guidance Report:")
                 print(f"{response.final_output}\n")
@@ -115,16 +168,18 @@ async def main():
                     print()
 
                 # Check if response contains clarifying questions
-                response_lower = response.final_output.lower()
-                if any(phrase in response_lower for phrase in [
-                    "could you", "can you", "would you", "what about", "tell me more",
-                    "clarify", "specify", "elaborate", "additional information"
-                ]):
+                if _CLARIFY_RE.search(response.final_output):
                     clarification_count += 1
                     if clarification_count <= max_clarifications:
-                        print(f"💡 The system asked clarifying questions. You can provide more details or ask a new question.\n")
+                        print(
+                            "💡 The system asked clarifying questions. "
+                            "You can provide more details or ask a new question.\n"
+                        )
                     else:
-                        print(f"⚠️ Maximum clarification rounds reached. The system provided guidance based on available information.\n")
+                        print(
+                            "⚠️ Maximum clarification rounds reached. "
+                            "The system provided guidance based on available information.\n"
+                        )
                         clarification_count = 0  # Reset for next conversation
                 else:
                     clarification_count = 0  # Reset when we get a complete response
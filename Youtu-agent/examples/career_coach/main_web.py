@@ -1,35 +1,56 @@
-import asyncio
+import os
 import pathlib
 import sys
-import os
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import bootstrap  # noqa: F401  # puts the project root on sys.path once
 
-from utu.agents import OrchestraAgent
-from utu.config import ConfigLoader
-from utu.ui.webui_chatbot import WebUIChatbot
+from utu.ui.launch import launch_orchestra_webui
 
 # Load environment variables (including ChromaDB and OpenAI credentials)
 try:
-    from utu.utils.env import EnvUtils
+    from utu.utils.env import EnvUtils  # noqa: F401  # imported for env-loading side effect
     print("✅ Environment variables loaded")
 except ImportError:
     print("⚠️  Could not load environment variables")
 except Exception as e:
     print(f"⚠️  Error loading environment variables: {e}")
 
+# Static startup banner, written in one go instead of a pile of print()
+# calls. Only dynamic lines (env checks) are printed separately below.
+BANNER = (
+    "🚀 Starting SAP Career Coach WebUI with ChromaDB Integration\n"
+    + "=" * 70
+    + """
+🔍 Checking environment configuration...
+✅ Using SentenceTransformers for embeddings (local model)
+"""
+)
+
+FEATURES_BANNER = """
+🤖 SAP Career Coach WebUI Features:
+- Multi-agent orchestra system with ChromaDB vector search integration
+- Onboarding Agent with access to comprehensive SAP policy documents
+- Real-time vector similarity search across 15+ policy documents
+- Data-driven recommendations based on actual company policies
+- Support for new hire onboarding, benefits enrollment, and policy questions
+
+💡 Try asking questions like:
+- 'What equipment will I receive on my first day at SAP?'
+- 'How do I set up my SAP email and access systems?'
+- 'What's the hotel limit for business travel to London?'
+- 'How much PTO do I accrue with 5 years of service?'
+- 'What are the company policies for remote work?'
+- 'How do I request IT support or troubleshoot issues?'
+
+"""
+
 
 def main():
-    print("🚀 Starting SAP Career Coach WebUI with ChromaDB Integration")
-    print("=" * 70)
+    sys.stdout.write(BANNER)
 
     # Verify ChromaDB environment variables
     chroma_data_path = os.getenv('CHROMA_DATA_PATH', './chroma_db_data')
 
-    print("🔍 Checking environment configuration...")
-    print("✅ Using SentenceTransformers for embeddings (local model)")
-
     # Check if ChromaDB data directory exists
     if os.path.exists(chroma_data_path):
         print(f"✅ ChromaDB data directory found: {chroma_data_path}")
@@ -37,39 +58,22 @@ def main():
         print(f"ℹ️  ChromaDB data directory not found: {chroma_data_path}")
         print("   Run document ingestion first: python scripts/ingest_chromadb_docs.py sample_documents/")
 
-    # Load the career coach orchestra configuration
-    config = ConfigLoader.load_agent_config("career_coach_orchestra")
-    config.planner_config["examples_path"] = pathlib.Path(__file__).parent / "planner_examples.json"
-
-    # Create the orchestra agent
-    runner = OrchestraAgent(config)
-
-    # Create data directory if it doesn't exist
-    data_dir = pathlib.Path(__file__).parent / "data"
-    data_dir.mkdir(exist_ok=True)
-
     # Enhanced example query that demonstrates ChromaDB vector search
-    question = "I'm new to SAP and starting tomorrow. What do I need to know about equipment, first day logistics, and available benefits?"
-
-    print("\n🤖 SAP Career Coach WebUI Features:")
-    print("- Multi-agent orchestra system with ChromaDB vector search integration")
-    print("- Onboarding Agent with access to comprehensive SAP policy documents")
-    print("- Real-time vector similarity search across 15+ policy documents")
-    print("- Data-driven recommendations based on actual company policies")
-    print("- Support for new hire onboarding, benefits enrollment, and policy questions")
-    print("\n💡 Try asking questions like:")
-    print("- 'What equipment will I receive on my first day at SAP?'")
-    print("- 'How do I set up my SAP email and access systems?'")
-    print("- 'What's the hotel limit for business travel to London?'")
-    print("- 'How much PTO do I accrue with 5 years of service?'")
-    print("- 'What are the company policies for remote work?'")
-    print("- 'How do I request IT support or troubleshoot issues?'")
-    print()
+    question = (
+        "I'm new to SAP and starting tomorrow. "
+        "What do I need to know about equipment, first day logistics, and available benefits?"
+    )
+
+    sys.stdout.write(FEATURES_BANNER)
+    sys.stdout.flush()
 
     # Launch the WebUI
-    ui = WebUIChatbot(runner, example_query=question)
-    print(f"🌐 Launching WebUI at http://{config.frontend_ip}:{config.frontend_port}")
-    ui.launch(port=config.frontend_port, ip=config.frontend_ip)
+    launch_orchestra_webui(
+        "career_coach_orchestra",
+        example_query=question,
+        examples_path=pathlib.Path(__file__).parent / "planner_examples.json",
+        data_dir=pathlib.Path(__file__).parent / "data",
+    )
 
 
 if __name__ == "__main__":
@@ -1,16 +1,24 @@
 from utu.agents import SimpleAgent
-from utu.config import ConfigLoader
-from utu.tools import SearchToolkit
+
+try:
+    from sap_agents.toolkits import get_toolkit
+except ImportError:  # imported from outside the example directory
+    from examples.career_coach.sap_agents.toolkits import get_toolkit
 
 
 def get_tools():
-    toolkit = SearchToolkit(ConfigLoader.load_toolkit_config("search"))
-    return toolkit.get_tools_in_agents_sync()
+    return get_toolkit("search").get_tools_in_agents_sync()
+
+
+async def get_tools_async():
+    """Async variant for orchestra build paths; shares the registry toolkit."""
+    return await get_toolkit("search").get_tools_in_agents()
 
 
 INSTRUCTIONS = (
     "You are a specialized SAP career research assistant. Your role is to gather comprehensive, up-to-date information "
-    "about SAP careers, job opportunities, industry trends, and professional development resources specifically for SAP employees.\n\n"
+    "about SAP careers, job opportunities, industry trends, and professional development resources "
+    "specifically for SAP employees.\n\n"
     "Key focus areas:\n"
     "- SAP career paths and progression opportunities\n"
     "- SAP-specific job market trends and salary data\n"
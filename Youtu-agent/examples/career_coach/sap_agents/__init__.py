@@ -1,14 +1,14 @@
 # SAP Career Coach Agents Package
 
-from .research_agent import research_agent, get_tools as get_research_tools
 from .analysis_agent import analysis_agent, get_tools as get_analysis_tools
-from .synthesis_agent import synthesis_agent, SAPCareerGuidance
+from .synthesis_agent import SAPCareerGuidance, synthesis_agent
+from .toolkits import TOOLKIT_REGISTRY, get_toolkit
 
 __all__ = [
-    'research_agent',
     'analysis_agent',
     'synthesis_agent',
     'SAPCareerGuidance',
-    'get_research_tools',
-    'get_analysis_tools'
+    'get_analysis_tools',
+    'get_toolkit',
+    'TOOLKIT_REGISTRY'
 ]
@@ -1,16 +1,29 @@
+import asyncio
+
 from utu.agents import SimpleAgent
-from utu.config import ConfigLoader
-from utu.tools import DocumentToolkit, PythonExecutorToolkit
+
+from .toolkits import get_toolkit
 
 
 def get_tools():
-    doc_toolkit = DocumentToolkit(ConfigLoader.load_toolkit_config("document"))
-    python_toolkit = PythonExecutorToolkit(ConfigLoader.load_toolkit_config("python_executor"))
+    doc_toolkit = get_toolkit("document")
+    python_toolkit = get_toolkit("python_executor")
     return doc_toolkit.get_tools_in_agents_sync() + python_toolkit.get_tools_in_agents_sync()
 
 
+async def get_tools_async():
+    """Initialize both toolkits concurrently; shares the registry instances."""
+    doc_toolkit = get_toolkit("document")
+    python_toolkit = get_toolkit("python_executor")
+    doc_tools, python_tools = await asyncio.gather(
+        doc_toolkit.get_tools_in_agents(), python_toolkit.get_tools_in_agents()
+    )
+    return doc_tools + python_tools
+
+
 INSTRUCTIONS = (
-    "You are a specialized SAP career analysis expert. Your role is to deeply analyze SAP employees' professional profiles, "
+    "You are a specialized SAP career analysis expert. "
+    "Your role is to deeply analyze SAP employees' professional profiles, "
     "career trajectories, skills gaps, and potential development paths within the SAP ecosystem.\n\n"
     "Analysis Focus Areas:\n"
     "- SAP module expertise and technical competencies\n"
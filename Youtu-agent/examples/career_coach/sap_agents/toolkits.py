@@ -0,0 +1,26 @@
+"""Shared toolkit registry for the career-coach agents.
+
+Each toolkit owns real resources (HTTP clients, a subprocess pool for the
+python executor), so agents must alias one shared instance per process
+instead of constructing their own copies at import time.
+"""
+
+from typing import Any
+
+from utu.config import ConfigLoader
+from utu.tools import DocumentToolkit, PythonExecutorToolkit, SearchToolkit
+
+_BUILDERS = {
+    "search": lambda: SearchToolkit(ConfigLoader.load_toolkit_config("search")),
+    "document": lambda: DocumentToolkit(ConfigLoader.load_toolkit_config("document")),
+    "python_executor": lambda: PythonExecutorToolkit(ConfigLoader.load_toolkit_config("python_executor")),
+}
+
+TOOLKIT_REGISTRY: dict[str, Any] = {}
+
+
+def get_toolkit(name: str):
+    """Return the process-wide toolkit instance for ``name``, building it on first use."""
+    if name not in TOOLKIT_REGISTRY:
+        TOOLKIT_REGISTRY[name] = _BUILDERS[name]()
+    return TOOLKIT_REGISTRY[name]
@@ -1,29 +1,19 @@
 import pathlib
 
 from examples.data_analysis.planner import DAPlannerAgent
-from utu.agents import OrchestraAgent
-from utu.config import ConfigLoader
-from utu.ui.webui_chatbot import WebUIChatbot
+from utu.ui.launch import launch_orchestra_webui
 
 
 def main():
-    # Set up the agent
-    config = ConfigLoader.load_agent_config("examples/data_analysis")
-    config.planner_config["examples_path"] = pathlib.Path(__file__).parent / "planner_examples_data.json"
-    config.reporter_config["template_path"] = pathlib.Path(__file__).parent / "web_reporter_sp.j2"
-    runner = OrchestraAgent(config)
-    planner = DAPlannerAgent(config)
-    # await runner.build()
-    runner.set_planner(planner)
-
-    # Run the agent with a sample question
     # data from https://www.kaggle.com/datasets/joannanplkrk/its-raining-cats
     fn = pathlib.Path(__file__).parent / "data" / "cat_breeds_clean.csv"
-
-    question = f"请分析位于`{fn}`的猫品种数据，提取有价值的信息。"
-    ui = WebUIChatbot(runner, example_query=question)
-
-    ui.launch(port=config.frontend_port, ip=config.frontend_ip)
+    launch_orchestra_webui(
+        "examples/data_analysis",
+        example_query=f"请分析位于`{fn}`的猫品种数据，提取有价值的信息。",
+        examples_path=pathlib.Path(__file__).parent / "planner_examples_data.json",
+        reporter_template=pathlib.Path(__file__).parent / "web_reporter_sp.j2",
+        planner_factory=DAPlannerAgent,
+    )
 
 
 if __name__ == "__main__":
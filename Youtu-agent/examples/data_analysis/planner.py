@@ -16,6 +16,10 @@ class DAPlannerAgent(PlannerAgent):
         )
 
     async def create_plan(self, task_recorder: OrchestraTaskRecorder) -> CreatePlanResult:
+        if self.output_parser is None:
+            # Planners swapped in via set_planner() after runner.build() never
+            # get built; initialize inline like the base class does
+            self._initialize_sync()
         background_info = await self._get_background_info(task_recorder)
         sp = self.jinja_env.get_template("planner_sp.j2").render(
             planning_examples=self._format_planner_examples(self.planner_examples)
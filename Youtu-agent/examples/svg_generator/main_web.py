@@ -1,22 +1,16 @@
 import pathlib
 
-from utu.agents import OrchestraAgent
-from utu.config import ConfigLoader
-from utu.ui.webui_chatbot import WebUIChatbot
+from utu.ui.launch import launch_orchestra_webui
 
 
 def main():
-    config = ConfigLoader.load_agent_config("examples/svg_generator")
-    config.planner_config["examples_path"] = pathlib.Path(__file__).parent / "planner_examples.json"
-    config.reporter_config["template_path"] = pathlib.Path(__file__).parent / "reporter_csv.j2"
-    runner = OrchestraAgent(config)
-
-    data_dir = pathlib.Path(__file__).parent / "data"
-    data_dir.mkdir(exist_ok=True)
-    question = "deepseek-v3.1有哪些亮点更新?"
-
-    ui = WebUIChatbot(runner, example_query=question)
-    ui.launch(port=config.frontend_port, ip=config.frontend_ip)
+    launch_orchestra_webui(
+        "examples/svg_generator",
+        example_query="deepseek-v3.1有哪些亮点更新?",
+        examples_path=pathlib.Path(__file__).parent / "planner_examples.json",
+        reporter_template=pathlib.Path(__file__).parent / "reporter_csv.j2",
+        data_dir=pathlib.Path(__file__).parent / "data",
+    )
 
 
 if __name__ == "__main__":
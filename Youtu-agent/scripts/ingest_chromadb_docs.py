@@ -4,19 +4,137 @@ Document Ingestion Script for ChromaDB
 Processes SAP policy documents and stores them in ChromaDB for vector search
 """
 
+import argparse
+import functools
+import hashlib
 import os
+import re
 import sys
-import json
-import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any
-import chromadb
-from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
-import time
+from typing import Any
+
+# Size BLAS/OMP thread pools to the machine before torch/transformers load;
+# containerized defaults frequently leave most cores idle during embedding
+_DEFAULT_THREADS = os.cpu_count() or 1
+os.environ.setdefault("OMP_NUM_THREADS", str(_DEFAULT_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(_DEFAULT_THREADS))
+
+import chromadb  # noqa: E402
+import numpy as np  # noqa: E402
+from chromadb.config import Settings  # noqa: E402
+from sentence_transformers import SentenceTransformer  # noqa: E402
+
+# Flush buffered chunks to ChromaDB once this many accumulate; batches in the
+# low hundreds amortize the per-transaction SQLite overhead of each add call
+BATCH_SIZE = 200
+
+# Encode once this many chunks have been parsed; large enough to keep the
+# embedder saturated while worker processes read and chunk the next files
+ENCODE_BATCH = 500
+
+# Document header fields, parsed with one multiline regex pass over the head.
+# The sample corpus writes headers in markdown bold ("**Policy Number:** ..."),
+# so the pattern tolerates surrounding asterisks; trailing bold markers are
+# stripped from the captured value at use
+_HEADER_RE = re.compile(
+    r"^\**\s*(Policy Number|Effective Date|Last Revised|Approved By|Document Owner)\s*:\**\s*(.+?)\s*$", re.M
+)
+_HEADER_FIELDS = {
+    "Policy Number": "policy_number",
+    "Effective Date": "effective_date",
+    "Last Revised": "last_revised",
+    "Approved By": "approved_by",
+    "Document Owner": "document_owner",
+}
+
+# Category tiers in priority order; the whole document is scanned once and the
+# highest-priority tier with any matching term wins
+_CATEGORY_TIERS = (
+    (("travel", "expense", "reimbursement", "per diem", "hotel"), "Finance", "Travel & Expenses"),
+    (("hr", "human resources", "onboarding", "pto", "vacation", "leave"), "HR", "General HR"),
+    (("security", "password", "vpn", "firewall", "encryption"), "IT", "Security"),
+    (("performance", "review", "development", "goals", "feedback"), "HR", "Performance Management"),
+    (("remote", "work", "hybrid", "flexible"), "HR", "Work Arrangements"),
+    (("benefits", "insurance", "retirement", "compensation"), "HR", "Benefits & Compensation"),
+    (("facility", "building", "parking", "office"), "Operations", "Facilities"),
+    (("it support", "help desk", "troubleshooting"), "IT", "Support"),
+    (("culture", "values", "company"), "Corporate", "Culture & Values"),
+)
+# Sentence/paragraph boundaries used to pick chunk break points; separate
+# patterns so positions stream straight into numpy without a per-match branch
+_PERIOD_RE = re.compile(r"\.")
+_NEWLINE_RE = re.compile(r"\n")
+
+# Whitespace-delimited words, counted without materializing a list
+_WORD_RE = re.compile(r"\S+")
+
+_TERM_TO_TIER = {
+    term: tier for tier, (terms, _, _) in enumerate(_CATEGORY_TIERS) for term in terms
+}
+# Longer alternatives first so e.g. "it support" is reported as itself
+_CATEGORY_RE = re.compile(
+    "|".join(re.escape(term) for term in sorted(_TERM_TO_TIER, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+# Supported document extensions
+SUFFIXES = {".txt", ".md", ".pdf"}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model(name: str = 'all-MiniLM-L6-v2', device: str = None) -> SentenceTransformer:
+    """Load the SentenceTransformer once per process.
+
+    Repeated ingester constructions in the same process (tests, notebooks)
+    reuse the loaded weights instead of re-reading ~80MB from disk.
+    """
+    return SentenceTransformer(name, device=device)
+
+
+def _iter_files(root):
+    """Yield supported document paths under root in a single scandir walk."""
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path)
+        elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUFFIXES:
+            yield Path(entry.path)
+
+
+def _read_and_chunk(file_path: Path) -> dict[str, Any]:
+    """Read, chunk and extract metadata for one document (subprocess worker)."""
+    result = {"file": str(file_path), "status": "completed", "chunks": [], "metadata": None, "error": None}
+    try:
+        with open(file_path, encoding='utf-8') as f:
+            content = f.read()
+
+        if len(content.strip()) < 100:
+            result["status"] = "skipped"
+            result["error"] = "Content too short"
+            return result
+
+        metadata = SAPDocumentIngester.extract_metadata(file_path, content)
+        chunks = SAPDocumentIngester.chunk_text(content)
+
+        if not chunks:
+            result["status"] = "skipped"
+            result["error"] = "No valid chunks generated"
+            return result
+
+        result["chunks"] = chunks
+        result["metadata"] = metadata
+
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+
+    return result
+
 
 class SAPDocumentIngester:
-    def __init__(self, data_path: str = "./chroma_db_data", collection_name: str = "sap_policies"):
+    def __init__(self, data_path: str = "./chroma_db_data", collection_name: str = "sap_policies",
+                 fast_ingest: bool = False, device: str = None, threads: int = None):
         """Initialize the document ingester."""
         self.data_path = data_path
         self.collection_name = collection_name
@@ -27,29 +145,220 @@ class SAPDocumentIngester:
             settings=Settings(anonymized_telemetry=False)
         )
 
-        # Initialize embedding model (SentenceTransformers only)
-        print("🔄 Loading SentenceTransformers embedding model...")
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-        print("✅ Using SentenceTransformers embeddings")
+        if fast_ingest:
+            self._apply_bulk_load_pragmas()
+
+        # Initialize embedding model: prefer a quantized ONNX Runtime session
+        # (~4x faster than the FP32 PyTorch forward on CPU) and fall back to
+        # SentenceTransformers when optimum/onnxruntime are unavailable
+        self.encode_batch_size = 64
+        if device is None and self._initialize_onnx_embedder():
+            self.embedding_model = None
+            print("✅ Using quantized ONNX Runtime embeddings")
+        else:
+            import torch
+            if device is None:
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            if device == "cpu":
+                if threads is None:
+                    # Prefer physical cores; hyperthread siblings add contention,
+                    # not throughput, for the BLAS-bound embedding forward
+                    try:
+                        import psutil
+                        threads = psutil.cpu_count(logical=False) or _DEFAULT_THREADS
+                    except ImportError:
+                        threads = _DEFAULT_THREADS
+                torch.set_num_threads(threads)
+            print(f"🔄 Loading SentenceTransformers embedding model on {device}...")
+            self.embedding_model = _get_model('all-MiniLM-L6-v2', device=device)
+            if device == "cuda":
+                # FP16 doubles GPU throughput at negligible retrieval accuracy cost
+                self.embedding_model.half()
+                self.encode_batch_size = 128
+            print(f"✅ Using SentenceTransformers embeddings on {device}")
+
+        # One round-trip instead of a get/except/create pair; HNSW params are
+        # applied at creation time so the index never needs a rebuild later
+        self.collection = self.client.get_or_create_collection(
+            self.collection_name,
+            metadata={"hnsw:space": "cosine", "hnsw:construction_ef": 200, "hnsw:M": 32},
+        )
+        print(f"✅ Using collection: {self.collection_name}")
+
+        # Cross-file buffer: chunks accumulate here and are flushed to the
+        # collection in BATCH_SIZE groups rather than one add per file
+        self._pending = {"ids": [], "documents": [], "embeddings": [], "metadatas": []}
 
-        # Create or get collection
+        # Disk cache of chunk embeddings keyed by content hash; re-ingesting
+        # unchanged documents skips the model entirely. Optional dependency.
+        try:
+            import diskcache
+            self._emb_cache = diskcache.Cache("./.emb_cache")
+        except ImportError:
+            self._emb_cache = None
+
+    def _initialize_onnx_embedder(self) -> bool:
+        """Export all-MiniLM-L6-v2 to ONNX with dynamic int8 quantization and open an ORT session.
+
+        Shares the cached quantized model next to the ChromaDB data directory
+        with the MCP server, so the export/quantize cost is paid once per
+        deployment. Returns False when optimum/onnxruntime are not installed.
+        """
+        try:
+            import onnxruntime as ort
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            from transformers import AutoTokenizer
+        except ImportError:
+            return False
+
+        try:
+            model_id = 'sentence-transformers/all-MiniLM-L6-v2'
+            onnx_dir = Path(self.data_path).parent / "onnx_minilm_int8"
+            quantized_path = onnx_dir / "model_quantized.onnx"
+
+            if not quantized_path.exists():
+                print("🔄 Exporting embedding model to quantized ONNX (one-time)...")
+                model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+                model.save_pretrained(onnx_dir)
+                quantizer = ORTQuantizer.from_pretrained(onnx_dir)
+                qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False)
+                quantizer.quantize(save_dir=onnx_dir, quantization_config=qconfig)
+
+            sess_options = ort.SessionOptions()
+            sess_options.intra_op_num_threads = os.cpu_count()
+            self._onnx_session = ort.InferenceSession(
+                str(quantized_path),
+                sess_options=sess_options,
+                providers=['CPUExecutionProvider']
+            )
+            self._onnx_tokenizer = AutoTokenizer.from_pretrained(model_id)
+            return True
+        except Exception as e:
+            print(f"⚠️ ONNX embedding path unavailable, falling back to SentenceTransformers: {e}")
+            self._onnx_session = None
+            return False
+
+    def _onnx_encode_batch(self, texts: list[str]) -> np.ndarray:
+        """Tokenize, run and mean-pool one mini-batch through ONNX Runtime."""
+        encoded = self._onnx_tokenizer(texts, padding=True, truncation=True, return_tensors="np")
+        token_embeddings = self._onnx_session.run(None, dict(encoded))[0]
+        mask = encoded["attention_mask"][:, :, np.newaxis].astype(np.float32)
+        embeddings = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        return (embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)).astype(np.float32)
+
+    def _apply_bulk_load_pragmas(self):
+        """Switch Chroma's SQLite backend into bulk-load mode for this run.
+
+        Chroma serializes every insert as a full transaction; relaxing
+        journaling/synchronization during a one-shot ingest cuts wall time
+        dramatically (see ChromaDB issue #875). Reaches into client internals,
+        so it degrades to a no-op if the private layout changes.
+        """
         try:
-            self.collection = self.client.get_collection(self.collection_name)
-            print(f"✅ Connected to existing collection: {self.collection_name}")
-        except:
-            self.collection = self.client.create_collection(self.collection_name)
-            print(f"✅ Created new collection: {self.collection_name}")
-
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embeddings using SentenceTransformers."""
-        return self.embedding_model.encode(text).tolist()
-
-    def chunk_text(self, text: str, chunk_size: int = 800, overlap: int = 150) -> List[str]:
-        """Split text into overlapping chunks for better retrieval."""
+            conn = self.client._server._sysdb._conn_pool.connect()
+            cursor = conn.cursor()
+            for pragma in (
+                "PRAGMA journal_mode=OFF",
+                "PRAGMA synchronous=OFF",
+                "PRAGMA temp_store=MEMORY",
+                "PRAGMA locking_mode=EXCLUSIVE",
+                "PRAGMA cache_size=-200000",
+            ):
+                cursor.execute(pragma)
+            print("⚡ Fast-ingest mode: SQLite bulk-load PRAGMAs applied")
+        except Exception as e:
+            print(f"⚠️  Could not apply fast-ingest PRAGMAs (continuing normally): {e}")
+
+    def _buffer_add(self, ids, documents, embeddings, metadatas):
+        """Queue chunks for insertion, flushing once BATCH_SIZE accumulate."""
+        self._pending["ids"].extend(ids)
+        self._pending["documents"].extend(documents)
+        self._pending["embeddings"].extend(embeddings)
+        self._pending["metadatas"].extend(metadatas)
+        if len(self._pending["ids"]) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Write any buffered chunks to the collection in one add call."""
+        if not self._pending["ids"]:
+            return
+        self.collection.add(
+            ids=self._pending["ids"],
+            documents=self._pending["documents"],
+            # One contiguous float32 matrix; Chroma consumes numpy directly so
+            # no per-value Python floats are materialized
+            embeddings=np.asarray(self._pending["embeddings"], dtype=np.float32),
+            metadatas=self._pending["metadatas"]
+        )
+        self._pending = {"ids": [], "documents": [], "embeddings": [], "metadatas": []}
+
+    def generate_embeddings(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts, consulting the disk cache.
+
+        Chunks already embedded in a previous run (keyed by a blake2b content
+        hash) are read back from the cache; only the misses go through the
+        model. Vectors are stored as float16 bytes to halve cache I/O.
+        """
+        if self._emb_cache is None:
+            return self._encode_sorted(texts)
+
+        out = [None] * len(texts)
+        keys = [hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts]
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._emb_cache.get(key)
+            if cached is not None:
+                out[i] = np.frombuffer(cached, dtype=np.float16).astype(np.float32)
+            else:
+                missing.append(i)
+
+        if missing:
+            embeddings = self._encode_sorted([texts[i] for i in missing])
+            for j, i in enumerate(missing):
+                out[i] = embeddings[j]
+                self._emb_cache.set(keys[i], embeddings[j].astype(np.float16).tobytes())
+
+        return np.asarray(out, dtype=np.float32)
+
+    def _encode_sorted(self, texts: list[str]) -> np.ndarray:
+        """Run the model over texts with SBERT-style smart batching.
+
+        Encoding all chunks in one call amortizes the transformer forward-pass
+        overhead across the batch instead of paying it per chunk. Texts are
+        encoded in length-sorted order so each mini-batch only pads to its own
+        longest element, then the embeddings are scattered back to the
+        original order.
+        """
+        order = np.argsort([len(t) for t in texts])
+        ordered = [texts[i] for i in order]
+        batch_size = self.encode_batch_size
+        if getattr(self, "_onnx_session", None) is not None:
+            embeddings = np.concatenate(
+                [self._onnx_encode_batch(ordered[i:i + batch_size]) for i in range(0, len(ordered), batch_size)]
+            )
+        else:
+            embeddings = self.embedding_model.encode(
+                ordered, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+            )
+        return embeddings[np.argsort(order)]
+
+    @staticmethod
+    def chunk_text(text: str, chunk_size: int = 800, overlap: int = 150) -> list[str]:
+        """Split text into overlapping chunks for better retrieval.
+
+        Boundary positions are collected in one pre-pass so each window does a
+        binary search instead of rfind scans that re-walk the overlap region.
+        """
         chunks = []
         start = 0
         text_length = len(text)
 
+        periods = np.fromiter((m.start() for m in _PERIOD_RE.finditer(text)), dtype=np.int64)
+        newlines = np.fromiter((m.start() for m in _NEWLINE_RE.finditer(text)), dtype=np.int64)
+
+        min_break = chunk_size * 0.7
+
         while start < text_length:
             end = start + chunk_size
 
@@ -57,19 +366,19 @@ class SAPDocumentIngester:
             if end >= text_length:
                 chunk = text[start:].strip()
             else:
-                # Try to break at sentence boundaries
-                chunk = text[start:end]
-                last_period = chunk.rfind('.')
-                last_newline = chunk.rfind('\n')
+                # Break at the last sentence boundary inside the window,
+                # preferring periods over newlines as before
+                period_idx = np.searchsorted(periods, end) - 1
+                newline_idx = np.searchsorted(newlines, end) - 1
 
-                if last_period > chunk_size * 0.7:
-                    end = start + last_period + 1
+                if period_idx >= 0 and periods[period_idx] - start > min_break:
+                    end = int(periods[period_idx]) + 1
                     chunk = text[start:end].strip()
-                elif last_newline > chunk_size * 0.7:
-                    end = start + last_newline + 1
+                elif newline_idx >= 0 and newlines[newline_idx] - start > min_break:
+                    end = int(newlines[newline_idx]) + 1
                     chunk = text[start:end].strip()
                 else:
-                    chunk = chunk.strip()
+                    chunk = text[start:end].strip()
 
             if len(chunk) > 50:  # Only keep substantial chunks
                 chunks.append(chunk)
@@ -78,77 +387,48 @@ class SAPDocumentIngester:
 
         return chunks
 
-    def extract_metadata(self, file_path: Path, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def extract_metadata(file_path: Path, content: str) -> dict[str, Any]:
         """Extract metadata from SAP document content."""
         metadata = {
             "source": file_path.name,
             "file_path": str(file_path),
-            "word_count": len(content.split()),
+            "word_count": sum(1 for _ in _WORD_RE.finditer(content)),
             "category": "General",
             "document_type": "policy"
         }
 
-        lines = content.split('\n')
-
-        # Extract policy information from first few lines
-        for line in lines[:15]:
-            line = line.strip()
-            if 'Policy Number:' in line:
-                policy_num = line.split('Policy Number:')[1].strip()
-                metadata["policy_number"] = policy_num
-                if 'SAP-POL-' in policy_num:
-                    metadata["policy_type"] = "corporate_policy"
-                elif 'SAP-SOP-' in policy_num:
-                    metadata["policy_type"] = "standard_operating_procedure"
-
-            elif 'Effective Date:' in line:
-                metadata["effective_date"] = line.split('Effective Date:')[1].strip()
-            elif 'Last Revised:' in line:
-                metadata["last_revised"] = line.split('Last Revised:')[1].strip()
-            elif 'Approved By:' in line:
-                metadata["approved_by"] = line.split('Approved By:')[1].strip()
-            elif 'Document Owner:' in line:
-                metadata["document_owner"] = line.split('Document Owner:')[1].strip()
-
-        # Categorize by content analysis
-        content_lower = content.lower()
-
-        if any(term in content_lower for term in ['travel', 'expense', 'reimbursement', 'per diem', 'hotel']):
-            metadata["category"] = "Finance"
-            metadata["subcategory"] = "Travel & Expenses"
-        elif any(term in content_lower for term in ['hr', 'human resources', 'onboarding', 'pto', 'vacation', 'leave']):
-            metadata["category"] = "HR"
-            if 'onboarding' in content_lower:
-                metadata["subcategory"] = "Onboarding"
-            elif 'pto' in content_lower or 'vacation' in content_lower:
-                metadata["subcategory"] = "Time Off"
-            else:
-                metadata["subcategory"] = "General HR"
-        elif any(term in content_lower for term in ['security', 'password', 'vpn', 'firewall', 'encryption']):
-            metadata["category"] = "IT"
-            metadata["subcategory"] = "Security"
-        elif any(term in content_lower for term in ['performance', 'review', 'development', 'goals', 'feedback']):
-            metadata["category"] = "HR"
-            metadata["subcategory"] = "Performance Management"
-        elif any(term in content_lower for term in ['remote', 'work', 'hybrid', 'flexible']):
-            metadata["category"] = "HR"
-            metadata["subcategory"] = "Work Arrangements"
-        elif any(term in content_lower for term in ['benefits', 'insurance', 'retirement', 'compensation']):
-            metadata["category"] = "HR"
-            metadata["subcategory"] = "Benefits & Compensation"
-        elif any(term in content_lower for term in ['facility', 'building', 'parking', 'office']):
-            metadata["category"] = "Operations"
-            metadata["subcategory"] = "Facilities"
-        elif any(term in content_lower for term in ['it support', 'help desk', 'troubleshooting']):
-            metadata["category"] = "IT"
-            metadata["subcategory"] = "Support"
-        elif any(term in content_lower for term in ['culture', 'values', 'company']):
-            metadata["category"] = "Corporate"
-            metadata["subcategory"] = "Culture & Values"
+        # Extract policy information from the document head in one regex pass
+        head = "\n".join(content.split("\n", 15)[:15])
+        for field, value in _HEADER_RE.findall(head):
+            metadata[_HEADER_FIELDS[field]] = value.rstrip("*").strip()
+
+        policy_num = metadata.get("policy_number")
+        if policy_num:
+            if 'SAP-POL-' in policy_num:
+                metadata["policy_type"] = "corporate_policy"
+            elif 'SAP-SOP-' in policy_num:
+                metadata["policy_type"] = "standard_operating_procedure"
+
+        # Categorize by content analysis: one scan collects every matching
+        # term, then the highest-priority tier wins (replaces eight separate
+        # any(term in content_lower ...) walks over the full document)
+        hits = {match.lower() for match in _CATEGORY_RE.findall(content)}
+        tiers = {_TERM_TO_TIER[hit] for hit in hits}
+        if tiers:
+            terms, category, subcategory = _CATEGORY_TIERS[min(tiers)]
+            metadata["category"] = category
+            if category == "HR" and subcategory == "General HR":
+                # HR tier refines its subcategory by which term matched
+                if 'onboarding' in hits:
+                    subcategory = "Onboarding"
+                elif 'pto' in hits or 'vacation' in hits:
+                    subcategory = "Time Off"
+            metadata["subcategory"] = subcategory
 
         return metadata
 
-    def process_document(self, file_path: Path) -> Dict[str, Any]:
+    def process_document(self, file_path: Path) -> dict[str, Any]:
         """Process a single document and add it to ChromaDB."""
         result = {
             "file": str(file_path),
@@ -161,7 +441,7 @@ class SAPDocumentIngester:
             print(f"📄 Processing: {file_path.name}")
 
             # Read document content
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, encoding='utf-8') as f:
                 content = f.read()
 
             if len(content.strip()) < 100:
@@ -182,36 +462,40 @@ class SAPDocumentIngester:
 
             print(f"   📊 Generated {len(chunks)} chunks")
 
-            # Add chunks to collection
-            for i, chunk in enumerate(chunks):
-                try:
-                    # Generate embedding
-                    embedding = self.generate_embedding(chunk)
-
-                    # Create chunk-specific metadata
-                    chunk_metadata = metadata.copy()
-                    chunk_metadata.update({
+            # Encode every chunk in one batched call, then add the whole file
+            # to the collection in a single transaction
+            try:
+                embeddings = self.generate_embeddings(chunks)
+
+                n = len(chunks)
+                stem = file_path.stem
+                # Content-derived ids are stable across runs, so re-ingesting
+                # the same file cannot mint duplicates the way a same-second
+                # timestamp suffix could
+                ids = [
+                    f"{stem}_chunk_{i}_{hashlib.blake2b(chunk.encode(), digest_size=8).hexdigest()}"
+                    for i, chunk in enumerate(chunks)
+                ]
+                metadatas = [
+                    {
+                        **metadata,
                         "chunk_index": i,
-                        "total_chunks": len(chunks),
+                        "total_chunks": n,
                         "chunk_length": len(chunk),
                         "chunk_start": i * (len(chunk) - 150),  # Approximate position
-                    })
+                    }
+                    for i, chunk in enumerate(chunks)
+                ]
 
-                    # Add to collection
-                    doc_id = f"{file_path.stem}_chunk_{i}_{int(time.time())}"
+                self._buffer_add(ids, chunks, embeddings, metadatas)
+                # Single-file callers have no later flush point, so persist
+                # the buffered chunks before reporting completion
+                self.flush()
 
-                    self.collection.add(
-                        ids=[doc_id],
-                        documents=[chunk],
-                        embeddings=[embedding],
-                        metadatas=[chunk_metadata]
-                    )
-
-                    result["chunks_added"] += 1
+                result["chunks_added"] = len(chunks)
 
-                except Exception as e:
-                    print(f"   ❌ Error adding chunk {i}: {e}")
-                    continue
+            except Exception as e:
+                print(f"   ❌ Error adding chunks: {e}")
 
             result["status"] = "completed"
             print(f"   ✅ Completed: {result['chunks_added']} chunks added")
@@ -223,30 +507,19 @@ class SAPDocumentIngester:
 
         return result
 
-    def process_directory(self, directory_path: str) -> Dict[str, Any]:
+    def process_directory(self, directory_path: str) -> dict[str, Any]:
         """Process all documents in a directory."""
         directory = Path(directory_path)
 
         if not directory.exists():
             return {"error": f"Directory not found: {directory_path}"}
 
-        # Find all text files
-        file_patterns = ["*.txt", "*.md", "*.pdf"]
-        files_to_process = []
-
-        for pattern in file_patterns:
-            files_to_process.extend(directory.rglob(pattern))
-
-        if not files_to_process:
-            return {"error": f"No supported files found in {directory_path}"}
-
-        print(f"🔍 Found {len(files_to_process)} files to process")
         print(f"📂 Directory: {directory_path}")
         print(f"📚 Collection: {self.collection_name}")
         print("=" * 60)
 
         results = {
-            "total_files": len(files_to_process),
+            "total_files": 0,
             "processed": 0,
             "skipped": 0,
             "errors": 0,
@@ -254,21 +527,85 @@ class SAPDocumentIngester:
             "file_results": []
         }
 
-        for file_path in files_to_process:
-            result = self.process_document(file_path)
-            results["file_results"].append(result)
+        # Producer/consumer: worker processes read + chunk + extract metadata
+        # while this process keeps the embedder busy on completed files
+        texts, ids, metadatas = [], [], []
+
+        def encode_and_buffer():
+            if not texts:
+                return
+            embeddings = self.generate_embeddings(texts)
+            self._buffer_add(ids, texts, embeddings, metadatas)
+            texts.clear()
+            ids.clear()
+            metadatas.clear()
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            # Single scandir walk feeds the pool directly; no per-pattern
+            # rglob lists are materialized first
+            futures = {pool.submit(_read_and_chunk, path): path for path in _iter_files(directory)}
+
+            if not futures:
+                return {"error": f"No supported files found in {directory_path}"}
+
+            results["total_files"] = len(futures)
+            print(f"🔍 Found {len(futures)} files to process")
+
+            for future in as_completed(futures):
+                parsed = future.result()
+                file_path = futures[future]
+                result = {
+                    "file": parsed["file"],
+                    "status": parsed["status"],
+                    "chunks_added": 0,
+                    "error": parsed["error"]
+                }
 
-            if result["status"] == "completed":
-                results["processed"] += 1
-                results["total_chunks"] += result["chunks_added"]
-            elif result["status"] == "skipped":
-                results["skipped"] += 1
-            else:
-                results["errors"] += 1
+                if parsed["status"] == "completed":
+                    chunks = parsed["chunks"]
+                    metadata = parsed["metadata"]
+                    print(f"📄 Processing: {file_path.name} ({len(chunks)} chunks)")
+
+                    n = len(chunks)
+                    stem = file_path.stem
+                    texts.extend(chunks)
+                    # Content-derived ids: stable across runs, no same-second collisions
+                    ids.extend(
+                        f"{stem}_chunk_{i}_{hashlib.blake2b(chunk.encode(), digest_size=8).hexdigest()}"
+                        for i, chunk in enumerate(chunks)
+                    )
+                    metadatas.extend(
+                        {
+                            **metadata,
+                            "chunk_index": i,
+                            "total_chunks": n,
+                            "chunk_length": len(chunk),
+                            "chunk_start": i * (len(chunk) - 150),  # Approximate position
+                        }
+                        for i, chunk in enumerate(chunks)
+                    )
+                    result["chunks_added"] = n
+
+                    if len(texts) >= ENCODE_BATCH:
+                        encode_and_buffer()
+
+                    results["processed"] += 1
+                    results["total_chunks"] += len(chunks)
+                elif parsed["status"] == "skipped":
+                    results["skipped"] += 1
+                else:
+                    print(f"   ❌ Error processing {file_path.name}: {parsed['error']}")
+                    results["errors"] += 1
+
+                results["file_results"].append(result)
+
+        # Drain the tail batch and whatever is still buffered below threshold
+        encode_and_buffer()
+        self.flush()
 
         return results
 
-    def get_collection_stats(self) -> Dict[str, Any]:
+    def get_collection_stats(self) -> dict[str, Any]:
         """Get statistics about the collection."""
         try:
             count = self.collection.count()
@@ -302,13 +639,32 @@ def main():
     parser.add_argument("--collection", default="sap_policies", help="ChromaDB collection name")
     parser.add_argument("--data-path", default="./chroma_db_data", help="ChromaDB data directory")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--threads", type=int, default=None,
+        help="CPU threads for the embedding forward pass; defaults to the "
+             "physical core count"
+    )
+    parser.add_argument(
+        "--device", default=None,
+        help="Embedding device for SentenceTransformers (e.g. cuda, cpu); "
+             "auto-detects CUDA when omitted"
+    )
+    parser.add_argument(
+        "--fast-ingest", action="store_true",
+        help="Relax SQLite durability (journal/sync off) for the duration of the "
+             "ingest; a crash mid-run can corrupt the database, so only use on "
+             "a fresh or disposable data directory"
+    )
 
     args = parser.parse_args()
 
     # Initialize ingester
     ingester = SAPDocumentIngester(
         data_path=args.data_path,
-        collection_name=args.collection
+        collection_name=args.collection,
+        fast_ingest=args.fast_ingest,
+        device=args.device,
+        threads=args.threads
     )
 
     print("🚀 Starting SAP Document Ingestion")
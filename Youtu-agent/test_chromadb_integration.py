@@ -3,15 +3,15 @@
 Test script for ChromaDB integration with SAP onboarding documents
 """
 
-import os
-import sys
 import json
+import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from chromadb_mcp_server import ChromaDBMCPServer
+from chromadb_mcp_server_new import ChromaDBMCPServer
+
 
 def test_chromadb_basic():
     """Test basic ChromaDB functionality."""
@@ -80,13 +80,16 @@ def test_vector_search(server):
         "What are the remote work policies?"
     ]
 
-    for query in test_queries:
-        print(f"\n🔍 Searching: '{query}'")
-        results = server.search_documents(query, n_results=3)
+    # One bulk call: the queries share a single batched embedding forward
+    # pass and a single ChromaDB query instead of five round trips
+    bulk = server.search_documents_bulk(test_queries, n_results=3)
+
+    for search in bulk["searches"]:
+        print(f"\n🔍 Searching: '{search['query']}'")
 
-        if results["results"]:
-            print(f"   📊 Found {len(results['results'])} results")
-            for result in results["results"][:2]:  # Show top 2
+        if search["results"]:
+            print(f"   📊 Found {len(search['results'])} results")
+            for result in search["results"][:2]:  # Show top 2
                 print(f"   • {result['source']} (Similarity: {result['similarity_score']:.3f})")
                 print(f"     \"{result['content'][:100]}...\"")
         else:
@@ -100,7 +103,7 @@ def test_collection_stats(server):
     print("=" * 50)
 
     stats = server.get_collection_info()
-    print(f"📊 Collection Statistics:")
+    print("📊 Collection Statistics:")
     print(f"   • Total documents: {stats.get('document_count', 0)}")
 
     if 'categories' in stats:
@@ -1,27 +1,60 @@
+import asyncio
+import copy
+import functools
+
+import pytest
+
 from utu.config import ConfigLoader
 from utu.eval.data import DBDataManager
 from utu.eval.processer import GAIAProcesser, WebWalkerProcesser
 
-config = ConfigLoader.load_eval_config("ww")
+_dataset_cache: dict[str, list] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_config(name: str):
+    return ConfigLoader.load_eval_config(name)
+
+
+def _config_for(dataset: str):
+    # Deep copy before mutating so tests cannot leak state through the cache
+    config = copy.deepcopy(_cached_config("ww"))
+    config.data.dataset = dataset
+    return config
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def _prefetch_datasets():
+    """Load both datasets concurrently once per session; the loads are I/O bound."""
+    datasets = ("GAIA_val", "WebWalkerQA")
+    missing = [d for d in datasets if d not in _dataset_cache]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(DBDataManager(_config_for(d)).load) for d in missing)
+    )
+    _dataset_cache.update(zip(missing, results, strict=True))
+
+
+def _load_first_sample(config):
+    if config.data.dataset not in _dataset_cache:
+        _dataset_cache[config.data.dataset] = DBDataManager(config).load()
+    return _dataset_cache[config.data.dataset][0]
 
 
 def test_gaia_processor():
-    config.data.dataset = "GAIA_val"
-    data_manager = DBDataManager(config)
+    config = _config_for("GAIA_val")
     processor = GAIAProcesser(config)
 
-    sample = data_manager.load()[0]
+    sample = _load_first_sample(config)
     print(f"> raw sample: {sample.as_dict()}")
     processor.preprocess_one(sample)
     print(f"> processed sample: {sample.augmented_question}")
 
 
 def test_webwalker_processor():
-    config.data.dataset = "WebWalkerQA"
-    data_manager = DBDataManager(config)
+    config = _config_for("WebWalkerQA")
     processor = WebWalkerProcesser(config)
 
-    sample = data_manager.load()[0]
+    sample = _load_first_sample(config)
     print(f"> raw sample: {sample.as_dict()}")
     processor.preprocess_one(sample)
     print(f"> processed sample: {sample.augmented_question}")
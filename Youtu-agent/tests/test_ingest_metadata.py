@@ -0,0 +1,25 @@
+import pathlib
+
+from scripts.ingest_chromadb_docs import SAPDocumentIngester
+
+SAMPLE_DOCS = pathlib.Path(__file__).parent.parent / "sample_documents"
+
+
+def test_extract_metadata_sample_document():
+    """Header extraction must handle the bold markdown headers used by the sample corpus."""
+    path = SAMPLE_DOCS / "SAP_Employee_Benefits_Policy.txt"
+    metadata = SAPDocumentIngester.extract_metadata(path, path.read_text())
+
+    assert metadata["policy_number"] == "SAP-POL-007"
+    assert metadata["policy_type"] == "corporate_policy"
+    assert metadata["effective_date"] == "January 1, 2024"
+    assert metadata["last_revised"] == "September 05, 2025"
+    assert metadata["approved_by"] == "Christian Klein, Chief Executive Officer"
+
+
+def test_extract_metadata_sop_document():
+    path = SAMPLE_DOCS / "SAP_Onboarding_SOP.txt"
+    metadata = SAPDocumentIngester.extract_metadata(path, path.read_text())
+
+    assert metadata["policy_number"] == "SAP-SOP-001"
+    assert metadata["policy_type"] == "standard_operating_procedure"
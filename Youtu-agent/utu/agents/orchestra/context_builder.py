@@ -0,0 +1,217 @@
+"""Worker-memory context building for the orchestra agent.
+
+Reads each worker's persistent memory once per turn, builds prompt context
+strings from the memory snapshot plus conversation history, and writes the
+turn's interaction back to every worker memory at end of turn.
+"""
+
+import asyncio
+import io
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+
+from ...utils import get_logger
+
+logger = get_logger(__name__)
+
+MEMORY_INTERACTION_SEPARATOR = "\n\n--- NEW INTERACTION ---\n"
+# Memory lines worth surfacing in prompt context, matched in one C-level pass
+# instead of a per-line strip/startswith loop; the group is the stripped line
+_RELEVANT_LINE_RE = re.compile(r"^[\t\f\v\r ]*((?:User:|Assistant:|---)(?:.*\S)?)[\t\f\v\r ]*$", re.M)
+# Worker memories are capped to this many interactions; without a cap every
+# turn rewrites the full session history (O(n^2) bytes over a session)
+MAX_MEMORY_ENTRIES = 20
+
+
+def _cap_memory(memory: str) -> str:
+    """Keep only the most recent interactions of a serialized worker memory."""
+    entries = deque(memory.split(MEMORY_INTERACTION_SEPARATOR), maxlen=MAX_MEMORY_ENTRIES)
+    return MEMORY_INTERACTION_SEPARATOR.join(entries)
+
+
+@dataclass(slots=True, frozen=True)
+class MemoryEntry:
+    """One stored interaction for a worker agent."""
+
+    agent_name: str
+    content: str
+    timestamp: float
+
+
+@dataclass(slots=True, frozen=True)
+class ContextSummary:
+    """Summary statistics for the context assembled in a turn."""
+
+    total_agents: int
+    agents_with_memory: int
+    total_characters: int
+
+
+def _get_memory_toolkit(worker):
+    """Find the memory toolkit of a worker agent, if it exposes one."""
+    toolkit = getattr(worker, "memory_toolkit", None)
+    if toolkit is None:
+        toolkit = getattr(getattr(worker, "agent", None), "memory_toolkit", None)
+    return toolkit
+
+
+async def _read_worker_memory(worker) -> str:
+    """Read the persistent memory of a single worker agent."""
+    toolkit = _get_memory_toolkit(worker)
+    if toolkit is None:
+        return ""
+    try:
+        return await toolkit.simple_memory(action="read")
+    except Exception as e:
+        logger.warning(f"Failed to read worker memory: {e}")
+        return ""
+
+
+async def _write_worker_memory(worker, content: str) -> None:
+    """Replace the persistent memory of a single worker agent."""
+    toolkit = _get_memory_toolkit(worker)
+    if toolkit is None:
+        return
+    try:
+        await toolkit.simple_memory(action="write", content=content)
+    except Exception as e:
+        logger.warning(f"Failed to write worker memory: {e}")
+
+
+async def get_memory_summary(agent) -> dict[str, str]:
+    """Read each worker's memory once and return an {agent_name: memory} snapshot.
+
+    The snapshot is reused for context building and memory updates within a
+    turn, so each worker memory is read exactly once per turn.
+    """
+    names = list(agent.worker_agents)
+    # Reads are independent I/O; gather them so the turn pays for the slowest
+    # worker memory rather than the sum (per-worker errors are already
+    # swallowed inside _read_worker_memory)
+    contents = await asyncio.gather(
+        *(_read_worker_memory(worker) for worker in agent.worker_agents.values())
+    )
+    return dict(zip(names, contents, strict=True))
+
+
+async def update_agent_memories_with_response(agent, memories: dict[str, str], user_input: str, response: str) -> None:
+    """Record the full turn in the snapshot and flush all worker memories concurrently.
+
+    This is the single memory write of a turn; the user input travels with the
+    response so no separate pre-run write is needed.
+    """
+    timestamp = time.monotonic()
+    for agent_name in memories:
+        entry = MemoryEntry(
+            agent_name=agent_name, content=f"User: {user_input}\nAssistant: {response}", timestamp=timestamp
+        )
+        memories[agent_name] = _cap_memory(memories[agent_name] + MEMORY_INTERACTION_SEPARATOR + entry.content)
+    await asyncio.gather(
+        *[
+            _write_worker_memory(worker, memories[name])
+            for name, worker in agent.worker_agents.items()
+            if name in memories
+        ]
+    )
+
+
+def build_memory_context_string(memories: dict[str, str], conversation_history: list[tuple[str, str]]) -> str:
+    """Module-level convenience wrapper over :meth:`ContextBuilder.build_memory_context_string`."""
+    return ContextBuilder().build_memory_context_string(memories, conversation_history)
+
+
+class ContextBuilder:
+    """Build prompt context strings from worker memories and conversation history."""
+
+    # Worker names whose mentions mark a line as insight-bearing
+    AGENT_NAME_MARKERS = ("ResearchAgent", "AnalysisAgent", "SkillsDevelopmentAgent", "SynthesisAgent")
+    # All insight markers folded into one alternation so each line is scanned
+    # once instead of once per marker plus a startswith check
+    _INSIGHT_RE = re.compile(
+        "|".join((*map(re.escape, AGENT_NAME_MARKERS), r"^(?:User:|Assistant:|Decision:|Insight:)"))
+    )
+
+    def __init__(self, max_context_length: int = 4000, max_history: int = 3):
+        self.max_context_length = max_context_length
+        self.max_history = max_history
+
+    def build_memory_context_string(
+        self, memories: dict[str, str], conversation_history: list[tuple[str, str]]
+    ) -> str:
+        """Assemble the memory/conversation context block injected into planner prompts."""
+        context, _ = self.build_planner_context(memories, conversation_history)
+        return context
+
+    def extract_key_insights(self, memory_text: str) -> list[str]:
+        """Pull out insight-bearing lines (questions, decisions, agent mentions) from a memory blob."""
+        insights = []
+        for position, line in enumerate(memory_text.split("\n")):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if self._INSIGHT_RE.search(stripped):
+                insights.append(f"{position}: {stripped}")
+        return insights
+
+    def build_planner_context(
+        self, memories: dict[str, str], conversation_history: list[tuple[str, str]]
+    ) -> tuple[str, ContextSummary]:
+        """Build the planner context string and its summary statistics in one pass."""
+        # Single growable buffer instead of a parts list plus join
+        buf = io.StringIO()
+        empty = True
+        agents_with_memory = 0
+        total_characters = 0
+
+        for agent_name, memory in memories.items():
+            if not memory:
+                continue
+            agents_with_memory += 1
+            total_characters += len(memory)
+            # One compiled-regex pass over the blob; the group is pre-stripped
+            relevant_lines = _RELEVANT_LINE_RE.findall(memory)
+            if relevant_lines:
+                if not empty:
+                    buf.write("\n")
+                buf.write(f"[{agent_name} memory]\n")
+                buf.write("\n".join(relevant_lines))
+                empty = False
+
+        if conversation_history:
+            if not empty:
+                buf.write("\n")
+            buf.write("[Recent conversation]")
+            # islice instead of a slice copy; also works for deque-backed histories
+            start = max(0, len(conversation_history) - self.max_history)
+            for question, answer in islice(conversation_history, start, None):
+                answer_snippet = answer[:200]
+                buf.write(f"\nQ: {question}\nA: {answer_snippet}")
+
+        context = buf.getvalue()
+        if len(context) > self.max_context_length:
+            context = self._truncate_context_unchecked(context)
+
+        summary = ContextSummary(
+            total_agents=len(memories),
+            agents_with_memory=agents_with_memory,
+            total_characters=total_characters,
+        )
+        return context, summary
+
+    def _truncate_context_unchecked(self, context: str) -> str:
+        """Truncate the context to the length budget, dropping the oldest lines first.
+
+        Assumes the caller has already established the context is over budget.
+        """
+        kept: deque[str] = deque()
+        length = 0
+        for line in reversed(context.split("\n")):
+            line_cost = len(line) + 1
+            if length + line_cost > self.max_context_length:
+                break
+            kept.appendleft(line)
+            length += line_cost
+        return "\n".join(kept)
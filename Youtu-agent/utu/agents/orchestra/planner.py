@@ -1,18 +1,162 @@
+import asyncio
+import functools
+import io
 import json
 import pathlib
 import re
+import sys
 
 from ...config import AgentConfig
-from ...utils import SimplifiedAsyncOpenAI, get_jinja_env
+from ...utils import SimplifiedAsyncOpenAI, get_jinja_env, get_logger
 from .common import AgentInfo, CreatePlanResult, OrchestraTaskRecorder, Subtask
 
+try:
+    # optional Rust JSON parser; stdlib fallback keeps it a soft dependency
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = get_logger(__name__)
+
+_DEFAULT_EXAMPLES_PATH = pathlib.Path(__file__).parent / "data" / "planner_examples.json"
+
+# Parsing patterns, compiled once at import so the per-response parse path
+# skips re's internal cache lookup. XML tags are located with str.find (see
+# _find_tag); these cover the markdown response format only.
+_ANALYSIS_MD_RE = re.compile(r"## Query Analysis\s*\n(.*?)(?=\n##|\n\d+\.|\Z)", re.DOTALL)
+_PLAN_MD_RE = re.compile(r"## Agent Action Plan\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+
+# JSON-schema response format mirroring CreatePlanResult, for providers that
+# support structured output (opt-in via planner_config.structured_output)
+_PLAN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "create_plan_result",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "analysis": {"type": "string"},
+                "todo": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "agent_name": {"type": "string"},
+                            "task": {"type": "string"},
+                        },
+                        "required": ["agent_name", "task"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["analysis", "todo"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    },
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_planner_examples_cached(path: str, mtime: float) -> tuple[dict, ...]:
+    """Load and pre-format planner examples once per (path, mtime).
+
+    Planners can be respawned per session; the examples file does not change
+    between constructions, so the parse and formatting are shared.
+    """
+    with open(path, "rb") as f:
+        examples = _json_loads(f.read())
+    # Formatting is deterministic; do it once at load instead of per use
+    for example in examples:
+        example["_formatted"] = PlannerAgent._format_planner_example(example)
+    return tuple(examples)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_agent_infos(workers_info_key: tuple) -> tuple[AgentInfo, ...]:
+    """Build AgentInfo objects once per distinct workers_info content."""
+    return tuple(AgentInfo(**dict(items)) for items in workers_info_key)
+
+
+def _parse_bullet_tasks(text: str) -> list[tuple[str, str]]:
+    """Parse single-line "- AgentName: responsibilities" bullets linewise.
+
+    Like _parse_numbered_tasks, a startswith/partition pass replaces the old
+    MULTILINE regex whose lazy quantifier plus alternation lookahead carried
+    backtracking risk (and silently swallowed the line after an empty bullet).
+    """
+    tasks = []
+    for line in text.splitlines():
+        s = line.lstrip()
+        if not s.startswith("-"):
+            continue
+        name, colon, desc = s[1:].lstrip().partition(":")
+        if colon and name.isalpha() and name.endswith("Agent"):
+            desc = desc.strip()
+            if desc:
+                tasks.append((name, desc))
+    return tasks
+
+
+def _parse_numbered_tasks(text: str) -> list[tuple[str, str]]:
+    """Parse "1. AgentName: responsibilities" blocks in one linewise pass.
+
+    Descriptions run until the next numbered agent line. LLM plan output is
+    line oriented, so startswith/partition dispatch beats a MULTILINE|DOTALL
+    regex with a lookahead and carries no backtracking risk.
+    """
+    tasks = []
+    current_name = None
+    buf = []
+    for line in text.splitlines():
+        s = line.lstrip()
+        if s[:1].isdigit():
+            num, dot, rest = s.partition(".")
+            if dot and num.isdigit():
+                name, colon, desc = rest.lstrip().partition(":")
+                if colon and name.isalpha() and name.endswith("Agent"):
+                    if current_name is not None:
+                        tasks.append((current_name, "\n".join(buf).strip()))
+                    current_name = name
+                    buf = [desc]
+                    continue
+        if current_name is not None:
+            buf.append(line)
+    if current_name is not None:
+        tasks.append((current_name, "\n".join(buf).strip()))
+    return tasks
+
+
+def _find_tag(text: str, open_tag: str, close_tag: str) -> str | None:
+    """Return the content of the first well-formed tag pair, or None.
+
+    Literal delimiters make str.find faster than a regex here, and each tag
+    costs at most two left-to-right scans of the response.
+    """
+    start = text.find(open_tag)
+    if start == -1:
+        return None
+    end = text.find(close_tag, start + len(open_tag))
+    if end == -1:
+        return None
+    return text[start + len(open_tag):end]
+
 
 class OutputParser:
     def __init__(self, available_agents=None):
-        # Patterns for both XML tags and markdown format
-        self.analysis_pattern = r"<analysis>(.*?)</analysis>|## Query Analysis\s*\n(.*?)(?=\n##|\n\d+\.|\Z)"
-        self.plan_pattern = r"<plan>(.*?)</plan>|## Agent Action Plan\s*\n(.*?)(?=\n##|\Z)"
         self.available_agents = available_agents or []
+        # Agent names from available agents (dynamic list), with the last-ditch
+        # mention pattern compiled once: any agent name followed by whitespace
+        # or colons. Escaped alternation, so no backtracking blowup on
+        # pathological responses.
+        # Names are interned so downstream equality checks hit pointer equality
+        self.agent_names = [sys.intern(agent.name) for agent in self.available_agents] or [
+            "ResearchAgent", "AnalysisAgent", "SkillsDevelopmentAgent", "SynthesisAgent"
+        ]
+        self._canonical_names = {name.lower(): name for name in self.agent_names}
+        self._agent_mention_re = re.compile(
+            r"(" + "|".join(map(re.escape, self.agent_names)) + r")[\s:]+", re.IGNORECASE
+        )
         # self.next_step_pattern = r'<next_step>\s*<agent>\s*(.*?)\s*</agent>\s*<task>\s*(.*?)\s*</task>\s*</next_step>'
         # self.task_finished_pattern = r'<task_finished>\s*</task_finished>'
 
@@ -22,85 +166,83 @@ class OutputParser:
         return CreatePlanResult(analysis=analysis, todo=plan)
 
     def _extract_analysis(self, text: str) -> str:
-        match = re.search(self.analysis_pattern, text, re.DOTALL)
-        if match:
-            # Return the first non-None capture group (either XML or markdown format)
-            for group in match.groups():
-                if group is not None:
-                    return group.strip()
-        return ""
+        # XML tags first (literal scan), then the markdown format
+        content = _find_tag(text, "<analysis>", "</analysis>")
+        if content is None and "## Query Analysis" in text:
+            match = _ANALYSIS_MD_RE.search(text)
+            content = match.group(1) if match else None
+        return content.strip() if content is not None else ""
 
     def _extract_plan(self, text: str) -> list[Subtask]:
-        match = re.search(self.plan_pattern, text, re.DOTALL)
-        if not match:
-            print(f"⚠️ No plan tags found in response. Looking for fallback patterns...")
+        # XML tags first (literal scan), then the markdown format
+        plan_content = _find_tag(text, "<plan>", "</plan>")
+        if plan_content is None and "## Agent Action Plan" in text:
+            match = _PLAN_MD_RE.search(text)
+            plan_content = match.group(1) if match else None
+        if plan_content is None:
+            logger.warning("No plan tags found in response. Looking for fallback patterns...")
             # Fallback: try to extract todo list content from the entire response
             return self._extract_plan_fallback(text)
 
-        # Get the first non-None capture group (either XML or markdown format)
-        plan_content = ""
-        for group in match.groups():
-            if group is not None:
-                plan_content = group.strip()
-                break
+        plan_content = plan_content.strip()
         tasks = []
-        # Parse numbered format: "1. AgentName: responsibilities"
-        numbered_pattern = r'^\s*\d+\.\s*([A-Za-z]+Agent):\s*(.+?)(?=\n\s*\d+\.\s*[A-Za-z]+Agent:|\Z)'
-        numbered_matches = re.findall(numbered_pattern, plan_content, re.MULTILINE | re.DOTALL)
+        # The numbered-task scan only runs over the plan slice, not the full response
+        numbered_matches = _parse_numbered_tasks(plan_content)
 
         if numbered_matches:
-            print(f"✅ Found {len(numbered_matches)} numbered tasks")
+            logger.debug(f"Found {len(numbered_matches)} numbered tasks")
             for agent_name, task_desc in numbered_matches:
-                tasks.append(Subtask(agent_name=agent_name, task=task_desc.strip(), completed=False))
+                tasks.append(Subtask(agent_name=agent_name, task=task_desc, completed=False))
             return tasks
 
-        print(f"⚠️ No valid numbered tasks found in plan content. Trying fallback...")
-        return self._extract_plan_fallback(text)
+        logger.warning("No valid numbered tasks found in plan content. Trying fallback...")
+        return self._extract_plan_fallback(text, already_tried_numbered=True)
 
-    def _extract_plan_fallback(self, text: str) -> list[Subtask]:
+    def _extract_plan_fallback(self, text: str, already_tried_numbered: bool = False) -> list[Subtask]:
         """Fallback method to extract plan when proper markdown format is not used"""
         tasks = []
 
-        # Get agent names from available agents (dynamic list)
-        agent_names = [agent.name for agent in self.available_agents] if self.available_agents else ["ResearchAgent", "AnalysisAgent", "SkillsDevelopmentAgent", "SynthesisAgent"]
-
-        # Try to parse numbered format: "1. AgentName: ..."
-        numbered_pattern = r'^\s*\d+\.\s*([A-Za-z]+Agent):\s*(.+?)(?=\n\s*\d+\.\s*[A-Za-z]+Agent:|\Z)'
-        numbered_matches = re.findall(numbered_pattern, text, re.MULTILINE | re.DOTALL)
+        # Try to parse numbered format: "1. AgentName: ..." — skipped when the
+        # primary path already ran the numbered scan and found nothing
+        if not already_tried_numbered:
+            numbered_matches = _parse_numbered_tasks(text)
 
-        if numbered_matches:
-            print(f"✅ Found {len(numbered_matches)} numbered tasks in fallback")
-            for agent_name, task_desc in numbered_matches:
-                tasks.append(Subtask(agent_name=agent_name, task=task_desc.strip(), completed=False))
-            return tasks
+            if numbered_matches:
+                logger.debug(f"Found {len(numbered_matches)} numbered tasks in fallback")
+                for agent_name, task_desc in numbered_matches:
+                    tasks.append(Subtask(agent_name=agent_name, task=task_desc, completed=False))
+                return tasks
 
         # Fallback to bullet point format: "- AgentName: ..."
-        task_pattern = r'^\s*-\s*([A-Za-z]+Agent):\s*(.+?)(?=\n\s*-\s*[A-Za-z]+Agent:|\s*$)'
-        task_matches = re.findall(task_pattern, text, re.MULTILINE)
+        task_matches = _parse_bullet_tasks(text)
 
         if task_matches:
             for agent_name, task_desc in task_matches:
-                tasks.append(Subtask(agent_name=agent_name, task=task_desc.strip(), completed=False))
-                print(f"✅ Extracted fallback todo for {agent_name}: {task_desc.strip()[:100]}...")
+                tasks.append(Subtask(agent_name=agent_name, task=task_desc, completed=False))
+                logger.debug(f"Extracted fallback todo for {agent_name}: {task_desc[:100]}...")
             return tasks
 
         # Fallback: Look for patterns like "ResearchAgent will..." or "ResearchAgent: ..."
-        for agent_name in agent_names:
-            agent_pattern = rf'{agent_name}[\s:]+(.*?)(?=(?:{"|".join(agent_names)}|$))'
-            match = re.search(agent_pattern, text, re.DOTALL | re.IGNORECASE)
-
-            if match:
-                task_desc = match.group(1).strip()
-                if task_desc:
-                    tasks.append(Subtask(agent_name=agent_name, task=task_desc, completed=False))
-                    print(f"✅ Extracted fallback task for {agent_name}: {task_desc[:100]}...")
-                # Note: No longer forcing all agents - only add if mentioned in the response
+        # One linear pass: each mention's task text runs to the next mention
+        # (first mention wins per agent; only mentioned agents are added)
+        mentions = list(self._agent_mention_re.finditer(text))
+        seen = set()
+        for i, mention in enumerate(mentions):
+            agent_name = self._canonical_names[mention.group(1).lower()]
+            if agent_name in seen:
+                continue
+            seen.add(agent_name)
+            end = mentions[i + 1].start() if i + 1 < len(mentions) else len(text)
+            task_desc = text[mention.end():end].strip()
+            if task_desc:
+                tasks.append(Subtask(agent_name=agent_name, task=task_desc, completed=False))
+                logger.debug(f"Extracted fallback task for {agent_name}: {task_desc[:100]}...")
 
         # If no agents were found in the text, this indicates a problem with the LLM response
         if not tasks:
-            print("⚠️ No agents found in LLM response, using minimal fallback")
+            logger.warning("No agents found in LLM response, using minimal fallback")
             # Use first available agent as fallback, not hardcoded
-            fallback_agent = agent_names[0] if agent_names else "ResearchAgent"
+            fallback_agent = self.agent_names[0]
             tasks.append(Subtask(
                 agent_name=fallback_agent,
                 task="Research SAP career information and provide relevant guidance",
@@ -115,9 +257,14 @@ class PlannerAgent:
         self.config = config
         self.llm = SimplifiedAsyncOpenAI(**self.config.planner_model.model_provider.model_dump())
         self.jinja_env = get_jinja_env(pathlib.Path(__file__).parent / "prompts")
-        self.planner_examples = self._load_planner_examples()
-        self.available_agents = self._load_available_agents()
-        self.output_parser = OutputParser(available_agents=self.available_agents)
+        # File I/O, validation and prompt rendering are deferred to build()
+        # so constructing a planner never blocks the event loop
+        self.planner_examples = None
+        self.available_agents = None
+        self.output_parser = None
+        self._system_prompt = None
+        self._formatted_agents = None
+        self._up_template = None
 
         # Memory toolkit for context awareness
         self.memory_toolkit = None
@@ -130,27 +277,43 @@ class PlannerAgent:
         return self.config.planner_config.get("name", "planner")
 
     def _load_planner_examples(self) -> list[dict]:
-        examples_path = self.config.planner_config.get("examples_path", "")
-        if examples_path and pathlib.Path(examples_path).exists():
-            examples_path = pathlib.Path(examples_path)
+        configured = self.config.planner_config.get("examples_path", "")
+        if configured and pathlib.Path(configured).is_file():
+            examples_path = pathlib.Path(configured)
         else:
-            examples_path = pathlib.Path(__file__).parent / "data" / "planner_examples.json"
-        with open(examples_path, encoding="utf-8") as f:
-            return json.load(f)
+            examples_path = _DEFAULT_EXAMPLES_PATH
+        return list(_load_planner_examples_cached(str(examples_path), examples_path.stat().st_mtime))
 
     def _load_available_agents(self) -> list[AgentInfo]:
-        available_agents = []
-        for info in self.config.workers_info:
-            available_agents.append(AgentInfo(**info))
-        return available_agents
+        try:
+            key = tuple(tuple(sorted(info.items())) for info in self.config.workers_info)
+        except TypeError:
+            # Unhashable values; build directly without the cache
+            return [AgentInfo(**info) for info in self.config.workers_info]
+        return list(_build_agent_infos(key))
+
+    def _initialize_sync(self):
+        if self.output_parser is not None:
+            return
+        self.planner_examples = self._load_planner_examples()
+        self.available_agents = self._load_available_agents()
+        self.output_parser = OutputParser(available_agents=self.available_agents)
+        # Examples and the agent roster are immutable after init; render the
+        # system prompt and the roster block once instead of per create_plan call
+        self._system_prompt = self.jinja_env.get_template("planner_sp.j2").render(
+            planning_examples=self._format_planner_examples(self.planner_examples)
+        )
+        self._formatted_agents = self._format_available_agents(self.available_agents)
+        self._up_template = self.jinja_env.get_template("planner_up.j2")
 
     async def build(self):
-        pass
+        await asyncio.to_thread(self._initialize_sync)
 
     async def create_plan(self, task_recorder: OrchestraTaskRecorder) -> CreatePlanResult:
-        sp = self.jinja_env.get_template("planner_sp.j2").render(
-            planning_examples=self._format_planner_examples(self.planner_examples)
-        )
+        if self.output_parser is None:
+            # Direct callers that skipped build(); cheap on a warm cache
+            self._initialize_sync()
+        sp = self._system_prompt
         # Inject memory context and conversation context into the user prompt
         background_info = self.memory_context if self.memory_context else ""
 
@@ -158,46 +321,66 @@ class PlannerAgent:
         if self.conversation_context:
             if background_info:
                 background_info += "\n\n"
-            background_info += f"RECENT CONVERSATION CONTEXT:\n{self.conversation_context}\n\nINSTRUCTIONS: Use this recent conversation context to understand the current query in relation to previous messages. Reference ongoing discussions and build upon previous responses."
+            background_info += (
+                f"RECENT CONVERSATION CONTEXT:\n{self.conversation_context}\n\n"
+                "INSTRUCTIONS: Use this recent conversation context to understand the current query in relation "
+                "to previous messages. Reference ongoing discussions and build upon previous responses."
+            )
 
-        up = self.jinja_env.get_template("planner_up.j2").render(
-            available_agents=self._format_available_agents(self.available_agents),
+        up = self._up_template.render(
+            available_agents=self._formatted_agents,
             question=task_recorder.task,
             background_info=background_info,
         )
         messages = [{"role": "system", "content": sp}, {"role": "user", "content": up}]
-        response = await self.llm.query_one(messages=messages, **self.config.planner_model.model_params.model_dump())
+        model_params = self.config.planner_model.model_params.model_dump()
+        if self.config.planner_config.get("structured_output", False):
+            # Providers with structured output return valid JSON directly,
+            # skipping the regex-scraping fallback layers
+            try:
+                response = await self.llm.query_one(
+                    messages=messages, response_format=_PLAN_RESPONSE_FORMAT, **model_params
+                )
+                return self._parse_structured(response)
+            except Exception as e:
+                logger.warning(f"Structured planner output failed ({e}); falling back to text parsing")
+        response = await self.llm.query_one(messages=messages, **model_params)
         return self.output_parser.parse(response)
 
+    @staticmethod
+    def _parse_structured(response: str) -> CreatePlanResult:
+        data = _json_loads(response)
+        todo = [Subtask(agent_name=item["agent_name"], task=item["task"], completed=False) for item in data["todo"]]
+        return CreatePlanResult(analysis=data.get("analysis", ""), todo=todo)
+
+    @staticmethod
+    def _format_planner_example(example: dict) -> str:
+        # format one example to string. example: {question/user_query, available_agents, analysis, plan}
+        # Handle both 'question' and 'user_query' keys for compatibility
+        question = example.get('question') or example.get('user_query', 'Unknown question')
+
+        # Format the plan as numbered list instead of JSON
+        plan_str = ""
+        if 'plan' in example and isinstance(example['plan'], list):
+            for i, plan_item in enumerate(example['plan'], 1):
+                if isinstance(plan_item, dict) and 'agent_name' in plan_item and 'task' in plan_item:
+                    plan_str += f"{i}. {plan_item['agent_name']}: {plan_item['task']}\n"
+
+        return (
+            f"Question: {question}\n"
+            f"<analysis>{example['analysis']}</analysis>\n"
+            f"<plan>{plan_str.strip()}</plan>\n"
+        )
+
     def _format_planner_examples(self, examples: list[dict]) -> str:
-        # format examples to string. example: {question/user_query, available_agents, analysis, plan}
-        examples_str = []
-        for example in examples:
-            # Handle both 'question' and 'user_query' keys for compatibility
-            question = example.get('question') or example.get('user_query', 'Unknown question')
-
-            # Format the plan as numbered list instead of JSON
-            plan_str = ""
-            if 'plan' in example and isinstance(example['plan'], list):
-                for i, plan_item in enumerate(example['plan'], 1):
-                    if isinstance(plan_item, dict) and 'agent_name' in plan_item and 'task' in plan_item:
-                        plan_str += f"{i}. {plan_item['agent_name']}: {plan_item['task']}\n"
-
-            examples_str.append(
-                f"Question: {question}\n"
-                f"<analysis>{example['analysis']}</analysis>\n"
-                f"<plan>{plan_str.strip()}</plan>\n"
-            )
-        return "\n".join(examples_str)
+        return "\n".join(example.get("_formatted") or self._format_planner_example(example) for example in examples)
 
     def _format_available_agents(self, agents: list[AgentInfo]) -> str:
-        agents_str = []
+        buf = io.StringIO()
         for agent in agents:
-            agents_str.append(
-                f"- {agent.name}: {agent.desc}\n  Best for: {agent.strengths}\n"
-                if agent.strengths
-                else f"  Weaknesses: {agent.weaknesses}\n"
-                if agent.weaknesses
-                else ""
-            )
-        return "\n".join(agents_str)
+            buf.write(f"- {agent.name}: {agent.desc}\n")
+            if agent.strengths:
+                buf.write(f"  Best for: {agent.strengths}\n")
+            if agent.weaknesses:
+                buf.write(f"  Weaknesses: {agent.weaknesses}\n")
+        return buf.getvalue()
@@ -1,3 +1,4 @@
+import functools
 from typing import TypeVar
 
 from hydra import compose, initialize
@@ -20,7 +21,15 @@ class ConfigLoader:
     @classmethod
     def _load_config_to_dict(cls, name: str = "default", config_path: str = None) -> DictConfig:
         config_path = config_path or cls.config_path
-        with initialize(config_path=config_path, version_base=cls.version_base):
+        return cls._compose_config(name, config_path, cls.version_base)
+
+    @staticmethod
+    @functools.cache
+    def _compose_config(name: str, config_path: str, version_base: str) -> DictConfig:
+        # Hydra composition re-parses every YAML involved; cache it per
+        # (name, path) so repeated loads across entry points are free. Callers
+        # still get a fresh pydantic config object per load_*_config call.
+        with initialize(config_path=config_path, version_base=version_base):
             cfg = compose(config_name=name)
             OmegaConf.resolve(cfg)
         return cfg
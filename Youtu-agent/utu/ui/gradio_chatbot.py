@@ -253,6 +253,19 @@ class GradioChatbot:
 
         self.ui = demo
 
+    async def launch_async(self, port=8848):
+        # Build and serve under the same loop: resources the agent attaches
+        # during build() (MCP sessions, HTTP clients) stay bound to a live
+        # loop instead of being orphaned and lazily rebuilt on first request.
+        await self.agent.build()
+        loop = asyncio.get_running_loop()
+        # With prevent_thread_lock=True launch() returns once the server is
+        # up, so awaiting the future surfaces startup failures (e.g. the port
+        # already bound) instead of silently parking forever below.
+        await loop.run_in_executor(
+            None, lambda: self.ui.launch(share=False, server_port=port, prevent_thread_lock=True)
+        )
+        await asyncio.Event().wait()
+
     def launch(self, port=8848):
-        asyncio.run(self.agent.build())
-        self.ui.launch(share=False, server_port=port)
+        asyncio.run(self.launch_async(port=port))
@@ -0,0 +1,49 @@
+"""Shared entry-point helper for the example WebUI launchers.
+
+The example ``main_web.py`` scripts all follow the same pattern: load an
+agent config, point the planner/reporter at example-local data files, build
+an :class:`OrchestraAgent` and launch the WebUI chatbot. This helper keeps
+that in one place so the examples stay thin.
+"""
+
+import pathlib
+
+from ..agents.orchestra_agent import OrchestraAgent
+from ..config import ConfigLoader
+from .webui_chatbot import WebUIChatbot
+
+
+def launch_orchestra_webui(
+    config_name: str,
+    *,
+    example_query: str = "",
+    examples_path: pathlib.Path = None,
+    reporter_template: pathlib.Path = None,
+    data_dir: pathlib.Path = None,
+    planner_factory=None,
+) -> None:
+    """Configure and launch an orchestra agent behind the WebUI chatbot.
+
+    Args:
+        config_name: Agent config name for :meth:`ConfigLoader.load_agent_config`.
+        example_query: Query pre-filled in the UI.
+        examples_path: Optional planner examples JSON (sets ``planner_config["examples_path"]``).
+        reporter_template: Optional reporter template (sets ``reporter_config["template_path"]``).
+        data_dir: Optional directory to create before launch.
+        planner_factory: Optional callable ``(config) -> PlannerAgent`` installed via ``set_planner``.
+    """
+    config = ConfigLoader.load_agent_config(config_name)
+    if examples_path is not None:
+        config.planner_config["examples_path"] = examples_path
+    if reporter_template is not None:
+        config.reporter_config["template_path"] = reporter_template
+
+    runner = OrchestraAgent(config)
+    if planner_factory is not None:
+        runner.set_planner(planner_factory(config))
+
+    if data_dir is not None:
+        data_dir.mkdir(exist_ok=True)
+
+    ui = WebUIChatbot(runner, example_query=example_query)
+    ui.launch(port=config.frontend_port, ip=config.frontend_ip)
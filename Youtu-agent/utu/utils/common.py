@@ -1,4 +1,5 @@
 import asyncio
+import functools
 
 from jinja2 import Environment, FileSystemLoader, Template
 from pydantic import BaseModel, Field
@@ -13,7 +14,10 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
     return loop
 
 
+@functools.cache
 def get_jinja_env(directory: str) -> Environment:
+    # Environments are safe to share and cache compiled templates internally,
+    # so one per prompts directory serves all callers
     return Environment(loader=FileSystemLoader(directory))
 
 
@@ -1,5 +1,8 @@
+import copy
+import functools
 import hashlib
 import pathlib
+import pickle
 import tempfile
 from typing import Any
 from urllib.parse import urlparse
@@ -15,6 +18,34 @@ def get_package_path() -> pathlib.Path:
 DIR_ROOT = get_package_path()
 CACHE_DIR = DIR_ROOT / ".cache"
 
+# libyaml-backed loader is ~10x faster than the pure-Python one when present
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(file_path: str, mtime: float) -> dict[str, Any]:
+    """Parse a YAML file once per (path, mtime); edits invalidate via the key.
+
+    Parses are additionally memoized on disk (pickle under ``CACHE_DIR``) so
+    fresh processes skip YAML parsing entirely; the mtime in the key
+    invalidates stale entries.
+    """
+    key = hashlib.md5(f"{file_path}:{mtime}".encode()).hexdigest()
+    cache_file = CACHE_DIR / "yaml" / f"{key}.pkl"
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except Exception:
+            pass  # corrupt cache entry; fall through and re-parse
+    with open(file_path) as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # cache dir not writable; the in-memory cache still applies
+    return data
+
 
 class FileUtils:
     @staticmethod
@@ -64,8 +95,8 @@ class FileUtils:
             file_path = pathlib.Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"File {file_path} does not exist")
-        with file_path.open() as f:
-            return yaml.safe_load(f)
+        # Deep-copied so callers can mutate the result without poisoning the cache
+        return copy.deepcopy(_load_yaml_cached(str(file_path), file_path.stat().st_mtime))
 
     @staticmethod
     def load_prompts(fn: str | pathlib.Path) -> dict[str, str]:
@@ -78,5 +109,4 @@ class FileUtils:
                 fn += ".yaml"
             fn = DIR_ROOT / "utu" / "prompts" / fn
         assert fn.exists(), f"File {fn} does not exist!"
-        with fn.open() as f:
-            return yaml.safe_load(f)
+        return copy.deepcopy(_load_yaml_cached(str(fn), fn.stat().st_mtime))